@@ -16,17 +16,21 @@ __all__ = ['errors', 'Mouth']
 # Ouroboros imports
 from config import config
 from strings import to_bool
-from tools import clone, evaluate
+from tools import evaluate
 
 # Python imports
 from base64 import b64decode
-from operator import itemgetter
+from collections import defaultdict
+from heapq import merge
+from operator import eq, ge, gt, itemgetter, le, lt, ne
 import re
 
 # Pip imports
 from brain import access
+from cachetools import TTLCache
 from RestOC import Record_Base, SMTP
 from RestOC.Services import Error, Response, Service
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 
@@ -36,38 +40,92 @@ from mouth.records import Locale, Template, TemplateEmail, TemplateSMS
 # Errors
 from mouth import errors
 
+_SPECIAL_CONDITIONALS = {
+	'$EMPTY': '',
+	'$NULL': None
+}
+"""Special conditional values"""
+
+_RE_IF_ELSE = re.compile(
+	r'\[[\t ]*if[\t ]+([A-Za-z_]+)(?:[\t ]+(==|<|<=|>|>=|!=)[\t ]+([^\]]+))?[\t ]*\]\n?(.+?)\n?(?:\[[\t ]*else[\t ]*\]\n?(.+?)\n?)?\[[\t ]*fi[\t ]*\]',
+	re.DOTALL
+)
+_RE_FI = re.compile(r'\[[\t ]*fi[\t ]*\]')
+_RE_DATA = re.compile(r'\{([A-Za-z_]+)\}')
+_RE_TPL = re.compile(r'\#([A-Za-z_]+)\#')
+_RE_REFS = re.compile(r'\#([A-Za-z_]+)\#|\{([A-Za-z_]+)\}')
+"""Regular expressions for parsing/replacing"""
+
+_CONDITIONAL = {
+	'==': eq,
+	'<': lt,
+	'<=': le,
+	'>': gt,
+	'>=': ge,
+	'!=': ne
+}
+"""Conditional functions"""
+
+_COERCE = {
+	bool: to_bool,
+	float: float,
+	int: int,
+	str: None,
+	type(None): None
+}
+"""Conditional value conversions by variable type, None for no conversion"""
+
 class Mouth(Service):
 	"""Mouth Service class
 
 	Service for outgoing communication
 	"""
 
-	_special_conditionals = {
-		'$EMPTY': '',
-		'$NULL': None
-	}
-	"""Special conditional values"""
-
-	_re_if_else = re.compile(
-		r'\[[\t ]*if[\t ]+([A-Za-z_]+)(?:[\t ]+(==|<|<=|>|>=|!=)[\t ]+([^\]]+))?[\t ]*\]\n?(.+?)\n?(?:\[[\t ]*else[\t ]*\]\n?(.+?)\n?)?\[[\t ]*fi[\t ]*\]',
-		re.DOTALL
-	)
-	_re_data = re.compile(r'\{([A-Za-z_]+)\}')
-	_re_tpl = re.compile(r'\#([A-Za-z_]+)\#')
-	"""Regular expressions for parsing/replacing"""
-
-	_conditional = {
-		'==': lambda x, y: x == y,
-		'<': lambda x, y: x < y,
-		'<=': lambda x, y: x <= y,
-		'>': lambda x, y: x > y,
-		'>=': lambda x, y: x >= y,
-		'!=': lambda x, y: x != y
-	}
-	"""Conditional lambdas"""
+	_contents = TTLCache(maxsize=512, ttl=60)
+	"""Existing template content by template ID, locale, and type, edits only \
+	clear it in the worker that handled them, so other workers can keep \
+	sending the old content for up to the 60 second TTL"""
 
-	@classmethod
-	def _checkTemplateContent(cls, content, names, variables):
+	_locales = TTLCache(maxsize=256, ttl=60)
+	_templates = TTLCache(maxsize=256, ttl=60)
+	"""Locale and template IDs recently confirmed to exist"""
+
+	_locales_list = TTLCache(maxsize=2, ttl=60)
+	"""Public locale lists, with and without archived locales"""
+
+	_names = TTLCache(maxsize=256, ttl=60)
+	"""Template IDs by lower case template name"""
+
+	_variables = TTLCache(maxsize=256, ttl=60)
+	"""Template variables by template ID"""
+
+	@staticmethod
+	def _allowed(allowed):
+		"""Allowed
+
+		Converts the allowed recipients from config into a set so checking \
+		if a recipient is allowed doesn't require going through a list
+
+		Arguments:
+			allowed (str|str[]|None): The recipient(s) from config
+
+		Returns:
+			frozenset | None
+		"""
+
+		# If there's nothing, anyone is allowed
+		if not allowed:
+			return None
+
+		# If we got a single recipient
+		if isinstance(allowed, str):
+			return frozenset([allowed])
+
+		# Return the set
+		return frozenset(allowed)
+
+	@staticmethod
+	def _checkTemplateContent(content, names, variables):
 		"""Check Template Content
 
 		Goes through template content and makes sure any variables or embedded \
@@ -86,49 +144,38 @@ class Mouth(Service):
 		lsTemplates = set()
 		lsVariables = set()
 
-		# Go through each of the content types
+		# Go through each of the content types present
 		for k in names:
-			try:
+			if k not in content:
+				continue
 
-				# Look for, and store, templates
-				for sTpl in cls._re_tpl.findall(content[k]):
+			# Look for, and store, templates and variables in one pass
+			for sTpl, sVar in _RE_REFS.findall(content[k]):
+				if sTpl:
 					lsTemplates.add(sTpl)
-
-				# Look for, and store, variables
-				for sVar in cls._re_data.findall(content[k]):
+				else:
 					lsVariables.add(sVar)
 
-			except KeyError:
-				pass
-
 		# Init errors list
 		lErrors = []
 
 		# If there's any templates
 		if lsTemplates:
 
-			# Look for all of them
-			lTemplates = [d['name'] for d in Template.filter({
+			# Look for all of them, names are matched without case just like
+			#	the DB does
+			lsFound = {d['name'].lower() for d in Template.filter({
 				'name': list(lsTemplates)
-			}, raw=['name'])]
+			}, raw=['name'])}
 
-			# If the count doesn't match
-			if len(lTemplates) != len(lsTemplates):
+			# Add any missing templates
+			for s in lsTemplates:
+				if s.lower() not in lsFound:
+					lErrors.append(['template', s])
 
-				# Get the missing templates
-				for s in lsTemplates:
-					if s not in lTemplates:
-						lErrors.append(['template', s])
-
-		# If there's any variables
-		if lsVariables:
-
-			# Go through each one
-			for s in lsVariables:
-
-				# If it's not in the templates list
-				if s not in variables:
-					lErrors.append(['variable', s])
+		# Add any variables not in the valid list
+		for s in lsVariables.difference(variables):
+			lErrors.append(['variable', s])
 
 		# Return errors (might be empty)
 		return lErrors
@@ -160,33 +207,32 @@ class Mouth(Service):
 				opts['attachments'] = [opts['attachments']]
 
 			# Loop through the attachments
-			for i in range(len(opts['attachments'])):
+			for i, dAttachment in enumerate(opts['attachments']):
 
 				# If we didn't get a dictionary
-				if not isinstance(opts['attachments'][i], dict):
+				if not isinstance(dAttachment, dict):
 					return Error(
 						errors.ATTACHMENT_STRUCTURE, 'attachments.[%d]' % i
 					)
 
-				# If the fields are missing
-				try:
-					evaluate(
-						opts['attachments'][i], ['body', 'filename']
-					)
-				except ValueError as e:
+				# If the fields are missing, or empty
+				lMissing = [
+					s for s in ['body', 'filename'] if not dAttachment.get(s)
+				]
+				if lMissing:
 					return Error(
 						errors.body.DATA_FIELDS,
 						[['attachments.[%d].%s' % (i, s), 'invalid'] \
-							for s in e.args]
+							for s in lMissing]
 					)
 
 				# Try to decode the base64
 				try:
-					opts['attachments'][i]['body'] = b64decode(
-						opts['attachments'][i]['body']
+					dAttachment['body'] = b64decode(dAttachment['body'])
+				except (ValueError, TypeError):
+					return Error(
+						errors.ATTACHMENT_DECODE, 'attachments.[%d]' % i
 					)
-				except TypeError:
-					return Response(errors.ATTACHMENT_DECODE)
 
 			# Set the attachments from the opts
 			mAttachments = opts['attachments']
@@ -196,9 +242,7 @@ class Mouth(Service):
 
 			# Send the e-mail
 			iRes = SMTP.send(
-				'override' in self._dEmail and \
-					self._dEmail['override'] or \
-					opts['to'],
+				self._sEmailOverride or opts['to'],
 				subject=opts['subject'],
 				text_body=opts['text'],
 				html_body=opts['html'],
@@ -216,6 +260,117 @@ class Mouth(Service):
 		# Return OK
 		return {'success': True}
 
+	@classmethod
+	def _fetch_embedded(cls, content, locale, type_):
+		"""Fetch Embedded
+
+		Finds every template embedded in the content, directly or through \
+		other embedded templates, and fetches their locale specific content \
+		using at most two queries per level of nesting instead of two per \
+		template, and none for templates fetched recently
+
+		Arguments:
+			content (str[]): The strings to search for embedded templates
+			locale (str): The locale of the content to fetch
+			type_ (str): The type of content, 'email' or 'sms'
+
+		Returns:
+			dict of str:mixed
+		"""
+
+		# Get the record class and fields for the type of content
+		if type_ == 'email':
+			oRecord = TemplateEmail
+			lFields = ['subject', 'text', 'html']
+		else:
+			oRecord = TemplateSMS
+			lFields = ['content']
+
+		# Init the return
+		dSources = {}
+
+		# Find the templates embedded at the top level
+		lsNames = set()
+		for s in content:
+			lsNames.update(_RE_TPL.findall(s))
+
+		# Keep going as long as there's templates we haven't fetched
+		while lsNames:
+
+			# Get the IDs of the templates we've found recently, by the name
+			#	as referenced, names are matched without case like the DB does
+			dIDs = {}
+			lsMissing = set()
+			for sTpl in lsNames:
+				try:
+					dIDs[sTpl] = cls._names[sTpl.lower()]
+				except KeyError:
+					lsMissing.add(sTpl)
+
+			# If there's any left
+			if lsMissing:
+
+				# Fetch their IDs by name
+				dFound = {d['name'].lower(): d['_id'] for d in Template.filter({
+					'name': list(lsMissing)
+				}, raw=['_id', 'name'])}
+
+				# Store the ones found, and mark any that don't exist
+				for sTpl in lsMissing:
+					sKey = sTpl.lower()
+					if sKey in dFound:
+						dIDs[sTpl] = dFound[sKey]
+						cls._names[sKey] = dFound[sKey]
+					else:
+						dSources[sTpl] = '!!!#%s# does not exist!!!' % sTpl
+
+			# Init the next level of templates
+			lsNames = set()
+
+			# Get the content we've fetched recently, noting the rest
+			dContents = {}
+			lMissing = []
+			for sID in set(dIDs.values()):
+				try:
+					dContents[sID] = cls._contents[(sID, locale, type_)]
+				except KeyError:
+					lMissing.append(sID)
+
+			# If there's any left
+			if lMissing:
+
+				# Fetch the content for all of them by locale, and store it
+				for d in oRecord.filter({
+					'template': lMissing,
+					'locale': locale
+				}, raw=['template'] + lFields):
+					sID = d.pop('template')
+					dContents[sID] = d
+					cls._contents[(sID, locale, type_)] = d
+
+			# Go through each template found
+			for sTpl, sID in dIDs.items():
+
+				# If there's no content for the locale
+				if sID not in dContents:
+					dSources[sTpl] = '!!!#%s.%s# does not exist!!!' % (
+						sTpl, locale
+					)
+					continue
+
+				# Store the content
+				dSources[sTpl] = dContents[sID]
+
+				# Look for templates embedded in the content
+				for k in lFields:
+					lsNames.update(_RE_TPL.findall(dSources[sTpl][k]))
+
+			# Remove any templates we've already fetched
+			lsNames.difference_update(dSources.keys())
+
+		# Return the content found
+		return dSources
+
 	@classmethod
 	def _generate_content(cls, content, variables):
 		"""Generate Content
@@ -231,101 +386,91 @@ class Mouth(Service):
 			str
 		"""
 
-		# Look for variables
-		for sVar in cls._re_data.findall(content):
+		# Variable callback
+		def _variable(oVariable):
 
-			# Replace the string with the data value
-			content = content.replace(
-				'{%s}' % sVar,
-				sVar in variables and \
-					str(variables[sVar]) or \
-					'!!!{%s} does not exist!!!' % sVar
-			)
+			# Get the name of the variable
+			sVar = oVariable.group(1)
 
-		# Look for if/else conditionals
-		for oConditional in cls._re_if_else.finditer(content):
+			# Return the data value, which may be an empty string
+			return str(variables[sVar]) if sVar in variables else \
+					'!!!{%s} does not exist!!!' % sVar
 
-			# Get the entire text to replace
-			sReplace = oConditional.group(0)
+		# Conditional callback
+		def _conditional(oConditional):
 
 			# Get the conditional parts
 			sVariable, sTest, mValue, sIf, sElse = oConditional.groups()
 
-			# Get the groups and the length
-			lGroups = list(oConditional.groups())
-
 			# If we have no test or value
 			if sTest is None and mValue is None:
 
 				# Get the status of the variable
 				bPassed = sVariable in variables and variables[sVariable]
 
-				# Figure out the replacement content
-				sNewContent = bPassed and sIf or (sElse or '')
+				# Return the replacement content
+				return sIf if bPassed else (sElse or '')
 
-				# Replace the content
-				content = content.replace(sReplace, sNewContent)
+			# Replace special tags in variable value
+			mValue = _SPECIAL_CONDITIONALS.get(mValue, mValue)
 
-			# Else, we have a condition and value to run
-			else:
+			# Check for the variable
+			if sVariable not in variables:
+				return 'INVALID VARIABLE (%s) IN CONDITIONAL' % sVariable
 
-				# Replace special tags in variable value
-				for n,v in cls._special_conditionals.items():
-					if mValue == n:
-						mValue = v
+			# If we didn't get None for the value
+			if mValue is not None:
 
-				# Check for the variable
-				if sVariable not in variables:
-					content = content.replace(
-						sReplace,
-						'INVALID VARIABLE (%s) IN CONDITIONAL' % sVariable
-					)
-					continue
+				# Get the type of value for the variable
+				oVarType = type(variables[sVariable])
 
-				# If we didn't get None for the value
-				if mValue is not None:
+				# Get the conversion, any type not listed converts using itself
+				fCoerce = _COERCE.get(oVarType, oVarType)
 
-					# Get the type of value for the variable
-					oVarType = type(variables[sVariable])
+				# Attempt to convert the value from a string if required
+				try:
+					if fCoerce:
+						mValue = fCoerce(mValue)
 
-					# Attempt to convert the value from a string if required
-					try:
+				# If we can't convert the value
+				except ValueError:
+					return '%s HAS INVALID VALUE IN CONDITIONAL' % sVariable
 
-						# If it's a bool
-						if oVarType == bool:
-							mValue = to_bool(mValue)
+			# Figure out if the condition passed or not, values that can't be
+			#	compared, like None with an ordering test, are invalid
+			try:
+				bPassed = _CONDITIONAL[sTest](variables[sVariable], mValue)
+			except TypeError:
+				return '%s HAS INVALID VALUE IN CONDITIONAL' % sVariable
 
-						# Else, if it's not a string
-						elif oVarType != str and oVarType != None:
-							mValue = oVarType(mValue)
+			# Return the inner text if it passed, else the else text, if any
+			return sIf if bPassed else (sElse or '')
 
-					# If we can't convert the value
-					except ValueError:
-						content = content.replace(
-							sReplace,
-							'%s HAS INVALID VALUE IN CONDITIONAL' % sVariable
-						)
-						continue
+		# Replace all variables in a single pass, if there can be any
+		if '{' in content:
+			content = _RE_DATA.sub(_variable, content)
 
-				# Figure out if the condition passed or not
-				bPassed = cls._conditional[lGroups[cls.COND_TYPE]](
-					variables[sVariable], mValue
-				)
+		# If there can't be any conditionals, there's nothing left to do
+		if '[' not in content:
+			return content
 
-				# Figure out the replacement content
-				sNewContent = bPassed and lGroups[cls.COND_IF_CONTENT] or (
-					lGroups[cls.COND_ELSE_CONTENT] or ''
-				)
+		# Find the end of the last [fi], no conditional can match past it, and
+		#	without the limit every unclosed [if] after it would make the regex
+		#	scan to the end of the content looking for one
+		iEnd = 0
+		for oFi in _RE_FI.finditer(content):
+			iEnd = oFi.end()
 
-				# Replace the conditional with the inner text if it passed, else
-				#	just remove it
-				content = content.replace(sReplace, sNewContent)
+		# Replace all if/else conditionals in a single pass
+		if iEnd:
+			content = _RE_IF_ELSE.sub(_conditional, content[:iEnd]) + \
+						content[iEnd:]
 
 		# Return new content
 		return content
 
 	@classmethod
-	def _generate_email(cls, content, locale, variables, templates=None):
+	def _generate_email(cls, content, locale, variables):
 		"""Generate Email
 
 		Takes content, locale, and variables, and renders the final result of \
@@ -336,80 +481,138 @@ class Mouth(Service):
 										'text', and 'html'
 			locale (str): The locale used for embedded templates
 			variables (dict of str:str): The variable names and their values
-			templates (dict of str:str): The templates already looked up
 
 		Returns:
 			dict of str:str
 		"""
 
-		# If there's no templates yet
-		if not templates:
-			templates = {}
+		# Fetch every embedded template at once
+		dSources = cls._fetch_embedded(
+			[content[s] for s in ['subject', 'text', 'html'] if s in content],
+			locale,
+			'email'
+		)
 
-		# Copy the contents
-		dContent = clone(content)
+		# Any that couldn't be found are already as rendered as they'll get
+		dTemplates = {}
+		for k,v in dSources.items():
+			if isinstance(v, str):
+				dTemplates[k] = {'subject': v, 'text': v, 'html': v}
 
-		# Go through each each part of the template
-		for s in ['subject', 'text', 'html']:
+		# Render the content and return it
+		return cls._render_email(
+			content, locale, variables, dTemplates, dSources
+		)
 
-			# If the part is somehow missing
-			if s not in dContent:
-				dContent[s] = '!!!%s missing!!!' % s
-				continue
+	@classmethod
+	def _generate_sms(cls, content, locale, variables):
+		"""Generate SMS
 
-			# Look for embedded templates
-			for sTpl in cls._re_tpl.findall(dContent[s]):
+		Takes content, locale, and variables, and renders the final result of \
+		the template
 
-				# If we don't have the template yet
-				if sTpl not in templates:
+		Arguments:
+			content (str): The content to be rendered
+			locale (str): The locale used for embedded templates
+			variables (dict of str:str): The variable names and their values
 
-					# Look for the primary template
-					dTemplate = Template.filter({
-						'name': sTpl
-					}, raw=['_id'], limit=1)
+		Returns:
+			str
+		"""
 
-					# If it doesn't exist
-					if not dTemplate:
-						templates[sTpl] = {
-							'subject': '!!!#%s# does not exist!!!' % sTpl,
-							'text': '!!!#%s# does not exist!!!' % sTpl,
-							'html': '!!!#%s# does not exist!!!' % sTpl
-						}
+		# Fetch every embedded template at once
+		dSources = cls._fetch_embedded([content], locale, 'sms')
 
-					# Else
-					else:
+		# Any that couldn't be found are already as rendered as they'll get
+		dTemplates = {}
+		for k,v in dSources.items():
+			if isinstance(v, str):
+				dTemplates[k] = v
 
-						# Look for the locale dContent
-						dEmail = TemplateEmail.filter({
-							'template': dTemplate['_id'],
-							'locale': locale
-						}, raw=['subject', 'text', 'html'], limit=1)
-
-						# If it doesn't exist
-						if not dEmail:
-							templates[sTpl] = {
-								'subject': '!!!#%s.%s# does not exist!!!' % (
-									sTpl, locale
-								),
-								'text': '!!!#%s.%s# does not exist!!!' % (
-									sTpl, locale
-								),
-								'html': '!!!#%s.%s# does not exist!!!' % (
-									sTpl, locale
-								)
-							}
-
-						# Else, generate the embedded template
-						else:
-							templates[sTpl] = cls._generate_email(
-								dEmail, locale, variables, templates
-							)
-
-				# Replace the string with the value from the child
-				dContent[s] = dContent[s].replace(
-					'#%s#' % sTpl, templates[sTpl][s]
+		# Render the content and return it
+		return cls._render_sms(
+			content, locale, variables, dTemplates, dSources
+		)
+
+	@classmethod
+	def _locale_exists(cls, _id):
+		"""Locale Exists
+
+		Returns the ID of the locale if it exists, else False, only going to \
+		the DB if it hasn't been confirmed recently
+
+		Arguments:
+			_id (str): The ID of the locale
+
+		Returns:
+			str | False
+		"""
+
+		# If we've confirmed it recently, return it
+		try:
+			return cls._locales[_id]
+		except KeyError:
+			pass
+
+		# Check the DB, and if it exists, store it
+		mExists = Locale.exists(_id)
+		if mExists:
+			cls._locales[_id] = mExists
+
+		# Return the result
+		return mExists
+
+	@classmethod
+	def _render_email(cls, content, locale, variables, templates, sources):
+		"""Render Email
+
+		Renders the three parts of the email template, and recursively any \
+		embedded templates, using the templates already fetched
+
+		Arguments:
+			content (dict of str:str): The content to be rendered, 'subject', \
+										'text', and 'html'
+			locale (str): The locale used for embedded templates
+			variables (dict of str:str): The variable names and their values
+			templates (dict of str:dict): The embedded templates already \
+											rendered
+			sources (dict of str:mixed): The embedded templates fetched by \
+											_fetch_embedded
+
+		Returns:
+			dict of str:str
+		"""
+
+		# Copy the parts of the content, the strings themselves are immutable so
+		#	there's no need for a deep copy
+		dContent = {
+			s: content.get(s, '!!!%s missing!!!' % s) \
+			for s in ['subject', 'text', 'html']
+		}
+
+		# Embedded template callback
+		def _template(oTemplate):
+
+			# Get the name of the template
+			sTpl = oTemplate.group(1)
+
+			# If we haven't rendered the template yet, do so
+			if sTpl not in templates:
+				templates[sTpl] = cls._render_email(
+					sources[sTpl], locale, variables, templates, sources
 				)
 
+			# Return the value from the child for the current part
+			return templates[sTpl][s]
+
+		# Go through each each part of the template
+		for s in dContent:
+
+			# Replace the embedded templates in a single pass, if there can
+			#	be any
+			if '#' in dContent[s]:
+				dContent[s] = _RE_TPL.sub(_template, dContent[s])
+
 			# Handle the variables and conditionals
 			dContent[s] = cls._generate_content(dContent[s], variables)
 
@@ -417,64 +620,47 @@ class Mouth(Service):
 		return dContent
 
 	@classmethod
-	def _generate_sms(cls, content, locale, variables, templates=None):
-		"""Generate SMS
+	def _render_sms(cls, content, locale, variables, templates, sources):
+		"""Render SMS
 
-		Takes content, locale, and variables, and renders the final result of \
-		the template
+		Renders the template, and recursively any embedded templates, using \
+		the templates already fetched
 
 		Arguments:
 			content (str): The content to be rendered
 			locale (str): The locale used for embedded templates
 			variables (dict of str:str): The variable names and their values
-			templates (dict of str:str): The templates already looked up
+			templates (dict of str:str): The embedded templates already \
+											rendered
+			sources (dict of str:mixed): The embedded templates fetched by \
+											_fetch_embedded
 
 		Returns:
 			str
 		"""
 
-		# If there's no templates yet
-		if not templates:
-			templates = {}
+		# Embedded template callback
+		def _template(oTemplate):
 
-		# Look for embedded templates
-		for sTpl in cls._re_tpl.findall(content):
+			# Get the name of the template
+			sTpl = oTemplate.group(1)
 
-			# If we don't have the template yet
+			# If we haven't rendered the template yet, do so
 			if sTpl not in templates:
+				templates[sTpl] = cls._render_sms(
+					sources[sTpl]['content'],
+					locale,
+					variables,
+					templates,
+					sources
+				)
 
-				# Look for the primary template
-				dTemplate = Template.filter({
-					'name': sTpl
-				}, raw=['_id'], limit=1)
-
-				# If it doesn't exist
-				if not dTemplate:
-					templates[sTpl] = '!!!#%s# does not exist!!!' % sTpl
-
-				# Else
-				else:
-
-					# Look for the locale dContent
-					dSMS = TemplateSMS.filter({
-						'template': dTemplate['_id'],
-						'locale': locale
-					}, raw=['content'], limit=1)
-
-					# If it doesn't exist
-					if not dSMS:
-						templates[sTpl] = '!!!#%s.%s# does not exist!!!' % (
-							sTpl, locale
-						)
-
-					# Else, generate the embedded template
-					else:
-						templates[sTpl] = cls._generate_sms(
-							dSMS['content'], locale, variables, templates
-						)
+			# Return the value from the child
+			return templates[sTpl]
 
-			# Replace the string with the value from the child
-			content = content.replace('#%s#' % sTpl, templates[sTpl])
+		# Replace the embedded templates in a single pass, if there can be any
+		if '#' in content:
+			content = _RE_TPL.sub(_template, content)
 
 		# Handle the variables and conditionals
 		content = cls._generate_content(content, variables)
@@ -497,22 +683,12 @@ class Mouth(Service):
 		# Only send if anyone is allowed, or the to is in the allowed
 		if not self._dSMS['allowed'] or opts['to'] in self._dSMS['allowed']:
 
-			# Init the base arguments
-			dArgs = {
-				'to': 'override' in self._dSMS and \
-						self._dSMS['override'] or \
-						opts['to'],
-				'body': opts['content']
-			}
-
-			# If we are using a service
-			if 'messaging_sid' in self._dSMS['twilio']:
-				dArgs['messaging_service_sid'] = \
-					self._dSMS['twilio']['messaging_sid']
-
-			# Else, use a phone number
-			else:
-				dArgs['from_'] = self._dSMS['twilio']['from_number']
+			# Init the arguments from the sender
+			dArgs = dict(
+				self._dSMSFrom,
+				to = self._sSMSOverride or opts['to'],
+				body = opts['content']
+			)
 
 			# Try to send the message via Twilio
 			try:
@@ -533,6 +709,182 @@ class Mouth(Service):
 					'error': [v for v in e.args]
 				}
 
+	@classmethod
+	def _template_content(cls, template, locale, type_):
+		"""Template Content
+
+		Returns the content of a template by locale and type, only going to \
+		the DB if it hasn't been fetched recently
+
+		Arguments:
+			template (str): The ID of the template
+			locale (str): The locale of the content
+			type_ (str): The type of content, 'email' or 'sms'
+
+		Returns:
+			dict | None
+		"""
+
+		# Generate the key
+		tKey = (template, locale, type_)
+
+		# If we already have it, return it
+		try:
+			return cls._contents[tKey]
+		except KeyError:
+			pass
+
+		# If we want the email content
+		if type_ == 'email':
+			dContent = TemplateEmail.filter({
+				'template': template,
+				'locale': locale
+			}, raw=['subject', 'text', 'html'], limit=1)
+
+		# Else, we want the sms content
+		else:
+			dContent = TemplateSMS.filter({
+				'template': template,
+				'locale': locale
+			}, raw=['content'], limit=1)
+
+		# If it exists, store it, missing content is never stored as it could
+		#	be created at any time by another worker
+		if dContent:
+			cls._contents[tKey] = dContent
+
+		# Return the content
+		return dContent
+
+	@classmethod
+	def _template_contents(cls, template):
+		"""Template Contents
+
+		Fetches all the email and sms content associated with one or more \
+		templates using one query per content type, sorted by locale and type
+
+		Arguments:
+			template (str|str[]): The ID(s) of the template(s)
+
+		Returns:
+			dict[]
+		"""
+
+		# Find all associated email content, sorted by locale, and mark the
+		#	type on the returned rows
+		lEmails = TemplateEmail.filter({
+			'template': template
+		}, raw=True, orderby='locale')
+		for d in lEmails:
+			d['type'] = 'email'
+
+		# Find all associated sms content, sorted by locale, and mark the
+		#	type on the returned rows
+		lSMSs = TemplateSMS.filter({
+			'template': template
+		}, raw=True, orderby='locale')
+		for d in lSMSs:
+			d['type'] = 'sms'
+
+		# Merge the two already sorted lists, on equal locales the email comes
+		#	first, which keeps the same order as sorting by locale and type
+		return list(merge(lEmails, lSMSs, key=itemgetter('locale')))
+
+	@classmethod
+	def _template_exists(cls, _id):
+		"""Template Exists
+
+		Returns the ID of the template if it exists, else False, only going \
+		to the DB if it hasn't been confirmed recently
+
+		Arguments:
+			_id (str): The ID of the template
+
+		Returns:
+			str | False
+		"""
+
+		# If we've confirmed it recently, return it
+		try:
+			return cls._templates[_id]
+		except KeyError:
+			pass
+
+		# Check the DB, and if it exists, store it
+		mExists = Template.exists(_id)
+		if mExists:
+			cls._templates[_id] = mExists
+
+		# Return the result
+		return mExists
+
+	@classmethod
+	def _template_id(cls, name):
+		"""Template ID
+
+		Returns the ID of the template with the given name, or None if there \
+		is no such template, only going to the DB if it hasn't been found \
+		recently
+
+		Arguments:
+			name (str): The name of the template
+
+		Returns:
+			str | None
+		"""
+
+		# If we've found it recently, return it, names are matched without case
+		#	just like the DB does
+		try:
+			return cls._names[name.lower()]
+		except KeyError:
+			pass
+
+		# Find the template by name
+		dTemplate = Template.filter({
+			'name': name
+		}, raw=['_id'], limit=1)
+
+		# If it's not found
+		if not dTemplate:
+			return None
+
+		# Store the ID and return it
+		cls._names[name.lower()] = dTemplate['_id']
+		return dTemplate['_id']
+
+	@classmethod
+	def _template_variables(cls, _id):
+		"""Template Variables
+
+		Returns the variables of the template, or None if the template \
+		doesn't exist, only going to the DB if they haven't been fetched \
+		recently
+
+		Arguments:
+			_id (str): The ID of the template
+
+		Returns:
+			dict | None
+		"""
+
+		# If we've fetched them recently, return them
+		try:
+			return cls._variables[_id]
+		except KeyError:
+			pass
+
+		# Fetch the template
+		dTemplate = Template.get(_id, raw=['variables'])
+
+		# If it's not found
+		if not dTemplate:
+			return None
+
+		# Store the variables and return them
+		cls._variables[_id] = dTemplate['variables']
+		return dTemplate['variables']
+
 	def email_create(self, req):
 		"""E-Mail
 
@@ -589,20 +941,15 @@ class Mouth(Service):
 			elif 'name' in req['data']['template']:
 
 				# Find the template by name
-				dTemplate = Template.filter({
-					'name': req['data']['template']['name']
-				}, raw=['_id'], limit=1)
+				sID = self._template_id(req['data']['template']['name'])
 
 				# If it's not found
-				if not dTemplate:
+				if not sID:
 					return Error(
 						errors.body.DB_NO_RECORD,
 						[req['data']['template']['name'], 'template']
 					)
 
-				# Store the ID
-				sID = dTemplate['_id']
-
 			# Else, no way to find the template
 			else:
 				return Error(
@@ -611,10 +958,9 @@ class Mouth(Service):
 				)
 
 			# Find the content by locale
-			dContent = TemplateEmail.filter({
-				'template': sID,
-				'locale': req['data']['template']['locale']
-			}, raw=['subject', 'text', 'html'], limit=1)
+			dContent = self._template_content(
+				sID, req['data']['template']['locale'], 'email'
+			)
 			if not dContent:
 				return Error(
 					errors.body.DB_NO_RECORD, [
@@ -645,10 +991,15 @@ class Mouth(Service):
 		dEmail['text'] = dContent['text']
 		dEmail['html'] = dContent['html']
 
-		# Send the email and return the response
-		return Response(
-			self._email(dEmail)
-		)
+		# Send the email
+		mRes = self._email(dEmail)
+
+		# If we got an error back, return it as is
+		if isinstance(mRes, Response):
+			return mRes
+
+		# Return the response
+		return Response(mRes)
 
 	def sms_create(self, req):
 		"""SMS
@@ -695,20 +1046,15 @@ class Mouth(Service):
 			elif 'name' in req['data']['template']:
 
 				# Find the template by name
-				dTemplate = Template.filter({
-					'name': req['data']['template']['name']
-				}, raw=['_id'], limit=1)
+				sID = self._template_id(req['data']['template']['name'])
 
 				# If it's not found
-				if not dTemplate:
+				if not sID:
 					return Error(
 						errors.body.DB_NO_RECORD,
 						[req['data']['template']['name'], 'template']
 					)
 
-				# Store the ID
-				sID = dTemplate['_id']
-
 			# Else, no way to find the template
 			else:
 				return Error(
@@ -717,10 +1063,9 @@ class Mouth(Service):
 				)
 
 			# Find the content by locale
-			dContent = TemplateSMS.filter({
-				'template': sID,
-				'locale': req['data']['template']['locale']
-			}, raw=['content'], limit=1)
+			dContent = self._template_content(
+				sID, req['data']['template']['locale'], 'sms'
+			)
 			if not dContent:
 				return Error(
 					errors.body.DB_NO_RECORD, [
@@ -772,6 +1117,12 @@ class Mouth(Service):
 			'override': None
 		})
 
+		# Store the email override so it's not looked up on every send
+		self._sEmailOverride = self._dEmail['override'] or None
+
+		# Convert the allowed email addresses to a set for quick lookups
+		self._dEmail['allowed'] = self._allowed(self._dEmail['allowed'])
+
 		# Fetch and store SMS config
 		self._dSMS = config.sms({
 			'active': False,
@@ -781,17 +1132,47 @@ class Mouth(Service):
 			'twilio': {
 				'account_sid': '',
 				'token': '',
-				'from_number': ''
+				'from_number': '',
+				'timeout': None
 			}
 		})
 
+		# Store the SMS override so it's not looked up on every send
+		self._sSMSOverride = self._dSMS['override'] or None
+
+		# Convert the allowed phone numbers to a set for quick lookups
+		self._dSMS['allowed'] = self._allowed(self._dSMS['allowed'])
+
 		# If SMS is active
 		if self._dSMS['active']:
 
-			# Create Twilio client
+			# If we are using a service
+			if 'messaging_sid' in self._dSMS['twilio']:
+				self._dSMSFrom = {
+					'messaging_service_sid': self._dSMS['twilio']['messaging_sid']
+				}
+
+			# Else, use a phone number
+			else:
+				self._dSMSFrom = {
+					'from_': self._dSMS['twilio']['from_number']
+				}
+
+			# Get the timeout, Twilio refuses anything that isn't above zero, so
+			#	treat those as no timeout
+			mTimeout = self._dSMS['twilio']['timeout']
+			if not mTimeout or mTimeout <= 0:
+				mTimeout = None
+
+			# Create Twilio client with the same pooled HTTP client it uses by
+			#	default, but with the configured timeout
 			self._oTwilio = Client(
 				self._dSMS['twilio']['account_sid'],
-				self._dSMS['twilio']['token']
+				self._dSMS['twilio']['token'],
+				http_client = TwilioHttpClient(
+					pool_connections = True,
+					timeout = mTimeout
+				)
 			)
 
 		# Return self for chaining
@@ -825,6 +1206,9 @@ class Mouth(Service):
 		except Record_Base.DuplicateException as e:
 			return Error(errors.body.DB_DUPLICATE, 'locale')
 
+		# Clear the cached lists
+		self._locales_list.clear()
+
 		# Return OK
 		return Response(True)
 
@@ -864,10 +1248,14 @@ class Mouth(Service):
 			# Mark the record as archived
 			oLocale['_archived'] = True
 
-			# Save it in the DB and return the result
-			return Response(
-				oLocale.save()
-			)
+			# Save it in the DB
+			bRes = oLocale.save()
+
+			# Clear the cached lists
+			self._locales_list.clear()
+
+			# Return the result
+			return Response(bRes)
 
 		# Check for templates with the locale
 		if TemplateEmail.count(filter={'locale': oLocale['_id']}) or \
@@ -879,10 +1267,15 @@ class Mouth(Service):
 				errors.body.DB_KEY_BEING_USED, (oLocale['_id'], 'locale')
 			)
 
-		# Delete the record and return the result
-		return Response(
-			oLocale.delete()
-		)
+		# Delete the record
+		bRes = oLocale.delete()
+
+		# Clear the cached ID and lists
+		self._locales.pop(req['data']['_id'], None)
+		self._locales_list.clear()
+
+		# Return the result
+		return Response(bRes)
 
 	def locale_exists_read(self, req):
 		"""Locale Exists
@@ -918,7 +1311,7 @@ class Mouth(Service):
 
 		# Return if it exists or not
 		return Response(
-			Locale.exists(req['data']['_id'])
+			self._locale_exists(req['data']['_id'])
 		)
 
 	def locale_read(self, req):
@@ -1009,14 +1402,18 @@ class Mouth(Service):
 		except ValueError as e:
 			return Error(errors.body.DATA_FIELDS, [e.args[0]])
 
-		# Save the record and return the result
+		# Save the record
 		try:
-			return Response(
-				oLocale.save()
-			)
+			bRes = oLocale.save()
 		except Record_Base.DuplicateException as e:
 			return Error(errors.body.DB_DUPLICATE, (req['data']['name'], 'template'))
 
+		# Clear the cached lists
+		self._locales_list.clear()
+
+		# Return the result
+		return Response(bRes)
+
 	def locales_read(self, req):
 		"""Locales read
 
@@ -1036,17 +1433,24 @@ class Mouth(Service):
 					'archived' in req['data'] and \
 					req['data']['archived']
 
-		# If we want to include archived data or not
-		filter = not bArchived and {'_archived': False} or None
+		# If we don't have the list cached
+		try:
+			lLocales = self._locales_list[bool(bArchived)]
+		except KeyError:
 
-		# Get and return all locales as raw data
-		return Response(
-			Locale.get(
+			# If we want to include archived data or not
+			filter = not bArchived and {'_archived': False} or None
+
+			# Get all locales as raw data and store them
+			lLocales = Locale.get(
 				filter=filter,
 				raw=['_id', 'name'],
 				orderby='name'
 			)
-		)
+			self._locales_list[bool(bArchived)] = lLocales
+
+		# Return the locales
+		return Response(lLocales)
 
 	def template_create(self, req):
 		"""Template create
@@ -1125,6 +1529,9 @@ class Mouth(Service):
 			# Delete it
 			o.delete(changes={'user': sUserID})
 
+			# Clear the cached content
+			self._contents.pop((o['template'], o['locale'], 'email'), None)
+
 		# For each sms template associated
 		for o in TemplateSMS.filter({
 			'template': req['data']['_id']
@@ -1133,10 +1540,19 @@ class Mouth(Service):
 			# Delete it
 			o.delete(changes={'user': sUserID})
 
-		# Delete the template and return the result
-		return Response(
-			oTemplate.delete(changes={'user': sUserID})
-		)
+			# Clear the cached content
+			self._contents.pop((o['template'], o['locale'], 'sms'), None)
+
+		# Delete the template
+		bRes = oTemplate.delete(changes={'user': sUserID})
+
+		# Clear the cached IDs and variables
+		self._templates.pop(req['data']['_id'], None)
+		self._names.pop(oTemplate['name'].lower(), None)
+		self._variables.pop(req['data']['_id'], None)
+
+		# Return the result
+		return Response(bRes)
 
 	def template_read(self, req):
 		"""Template read
@@ -1170,51 +1586,15 @@ class Mouth(Service):
 					errors.body.DB_NO_RECORD, [req['data']['_id'], 'template']
 				)
 
-			# Fetch all email templates with the IDs
-			lEmails = TemplateEmail.filter({
-				'template': req['data']['_id']
-			}, raw = True)
+			# Go through all the content and store it by it's template
+			dContents = defaultdict(list)
+			for d in self._template_contents(req['data']['_id']):
+				dContents[d['template']].append(d)
 
-			# Go through each email and store it by it's template
-			dEmails = {}
-			for d in lEmails:
-				d['type'] = 'email'
-				try:
-					dEmails[d['template']].append(d)
-				except KeyError:
-					dEmails[d['template']] = [d]
-
-			# Fetch all email templates with the IDs
-			lSMSs = TemplateSMS.filter({
-				'template': req['data']['_id']
-			}, raw = True)
-
-			# Go through each email and store it by it's template
-			dSMSs = {}
-			for d in lSMSs:
-				d['type'] = 'sms'
-				try:
-					dSMSs[d['template']].append(d)
-				except KeyError:
-					dSMSs[d['template']] = [d]
-
-			# Go through each template and add the emails and sms messages
+			# Go through each template and add its content, which is already
+			#	sorted by locale and type
 			for d in dTemplate:
-				d['content'] = []
-
-				# Add the email templates
-				if d['_id'] in dEmails:
-					d['content'].extend(dEmails[d['_id']])
-
-				# Add the SMS templates
-				if d['_id'] in dSMSs:
-					d['content'].extend(dSMSs[d['_id']])
-
-				# If there's content
-				if len(d['content']) > 1:
-
-					# Sort it by locale and type
-					d['content'].sort(key=itemgetter('locale', 'type'))
+				d['content'] = dContents.get(d['_id'], [])
 
 		# Else, it's most likely one
 		else:
@@ -1225,30 +1605,10 @@ class Mouth(Service):
 					errors.body.DB_NO_RECORD, (req['data']['_id'], 'template')
 				)
 
-			# Init the list of content
-			dTemplate['content'] = []
-
-			# Find all associated email content
-			dTemplate['content'].extend([
-				dict(d, type='email') for d in
-				TemplateEmail.filter({
-					'template': req['data']['_id']
-				}, raw=True)
-			])
-
-			# Find all associated sms content
-			dTemplate['content'].extend([
-				dict(d, type='sms') for d in
-				TemplateSMS.filter({
-					'template': req['data']['_id']
-				}, raw=True)
-			])
-
-			# If there's content
-			if len(dTemplate['content']) > 1:
-
-				# Sort it by locale and type
-				dTemplate['content'].sort(key=itemgetter('locale', 'type'))
+			# Find all associated content
+			dTemplate['content'] = self._template_contents(
+				req['data']['_id']
+			)
 
 		# Return the template
 		return Response(dTemplate)
@@ -1286,33 +1646,41 @@ class Mouth(Service):
 
 		# Remove fields that can't be updated
 		for k in ['_id', '_created', '_updated']:
-			try: del req['data'][k]
-			except KeyError: pass
+			req['data'].pop(k, None)
 
 		# If there's nothing left
 		if not req['data']:
 			return Response(False)
 
+		# Store the current name
+		sName = oTemplate['name']
+
 		# Init errors list
 		lErrors = []
 
 		# Update remaining fields
-		for k in req['data']:
+		for k,v in req['data'].items():
 			try:
-				oTemplate[k] = req['data'][k]
+				oTemplate[k] = v
 			except ValueError as e:
 				lErrors.extend(e.args[0])
 
-		# Save the record and return the result
+		# Save the record
 		try:
-			return Response(
-				oTemplate.save(changes={'user': sUserID})
-			)
+			bRes = oTemplate.save(changes={'user': sUserID})
 		except Record_Base.DuplicateException as e:
 			return Error(
 				errors.body.DB_DUPLICATE, (req['data']['name'], 'template')
 			)
 
+		# Clear the cached ID of the old name, and the variables, in case they
+		#	changed
+		self._names.pop(sName.lower(), None)
+		self._variables.pop(oTemplate['_id'], None)
+
+		# Return the result
+		return Response(bRes)
+
 	def template_contents_read(self, req):
 		"""Template Contents read
 
@@ -1334,38 +1702,15 @@ class Mouth(Service):
 			return Error(errors.body.DATA_FIELDS, [['template', 'missing']])
 
 		# If the template doesn't exist
-		if not Template.exists(req['data']['template']):
+		if not self._template_exists(req['data']['template']):
 			return Error(
 				errors.body.DB_NO_RECORD, [req['data']['template'], 'template']
 			)
 
-		# Init the list of content
-		lContents = []
-
-		# Find all associated email content
-		lContents.extend([
-			dict(d, type='email') for d in
-			TemplateEmail.filter({
-				'template': req['data']['template']
-			}, raw=True)
-		])
-
-		# Find all associated sms content
-		lContents.extend([
-			dict(d, type='sms') for d in
-			TemplateSMS.filter({
-				'template': req['data']['template']
-			}, raw=True)
-		])
-
-		# If there's content
-		if len(lContents) > 1:
-
-			# Sort it by locale and type
-			lContents.sort(key=itemgetter('locale', 'type'))
-
-		# Return the template
-		return Response(lContents)
+		# Find all associated content and return it
+		return Response(
+			self._template_contents(req['data']['template'])
+		)
 
 	def template_email_create(self, req):
 		"""Template Email create
@@ -1392,14 +1737,14 @@ class Mouth(Service):
 			)
 
 		# Make sure the template exists
-		dTemplate = Template.get(req['data']['template'], raw=['variables'])
-		if not dTemplate:
+		dVariables = self._template_variables(req['data']['template'])
+		if dVariables is None:
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['template'], 'template')
 			)
 
 		# Make sure the locale exists
-		if not Locale.exists(req['data']['locale']):
+		if not self._locale_exists(req['data']['locale']):
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['locale'], 'locale')
 			)
@@ -1414,7 +1759,7 @@ class Mouth(Service):
 		lErrors = self._checkTemplateContent(
 			req['data'],
 			['subject', 'text', 'html'],
-			dTemplate['variables']
+			dVariables
 		)
 
 		# If there's any errors
@@ -1430,6 +1775,9 @@ class Mouth(Service):
 				(req['data']['locale'], 'template_locale')
 			)
 
+		# Clear the cached content
+		self._contents.pop((oEmail['template'], oEmail['locale'], 'email'), None)
+
 		# Return the ID to indicate OK
 		return Response(oEmail['_id'])
 
@@ -1463,10 +1811,14 @@ class Mouth(Service):
 				(req['data']['_id'], 'template_email')
 			)
 
-		# Delete the record and return the result
-		return Response(
-			oEmail.delete(changes={'user': sUserID})
-		)
+		# Delete the record
+		bRes = oEmail.delete(changes={'user': sUserID})
+
+		# Clear the cached content
+		self._contents.pop((oEmail['template'], oEmail['locale'], 'email'), None)
+
+		# Return the result
+		return Response(bRes)
 
 	def template_email_update(self, req):
 		"""Template Email update
@@ -1499,8 +1851,7 @@ class Mouth(Service):
 
 		# Remove fields that can't be updated
 		for k in ['_id', '_created', '_updated', 'template', 'locale']:
-			try: del req['data'][k]
-			except KeyError: pass
+			req['data'].pop(k, None)
 
 		# If there's nothing left
 		if not req['data']:
@@ -1510,9 +1861,9 @@ class Mouth(Service):
 		lErrors = []
 
 		# Update remaining fields
-		for k in req['data']:
+		for k,v in req['data'].items():
 			try:
-				oEmail[k] = req['data'][k]
+				oEmail[k] = v
 			except ValueError as e:
 				lErrors.extend(e.args[0])
 
@@ -1520,24 +1871,31 @@ class Mouth(Service):
 		if lErrors:
 			return Error(errors.body.DATA_FIELDS, lErrors)
 
-		# Find the primary template variables
-		dTemplate = Template.get(oEmail['template'], raw=['variables'])
+		# If any of the content is being changed
+		if any(k in req['data'] for k in ['subject', 'text', 'html']):
 
-		# Check content for errors
-		lErrors = self._checkTemplateContent(
-			req['data'],
-			['subject', 'text', 'html'],
-			dTemplate['variables']
-		)
+			# Find the primary template variables
+			dVariables = self._template_variables(oEmail['template'])
 
-		# If there's any errors
-		if lErrors:
-			return Error(errors.TEMPLATE_CONTENT_ERROR, lErrors)
+			# Check content for errors
+			lErrors = self._checkTemplateContent(
+				req['data'],
+				['subject', 'text', 'html'],
+				dVariables
+			)
 
-		# Save the record and return the result
-		return Response(
-			oEmail.save(changes={'user': sUserID})
-		)
+			# If there's any errors
+			if lErrors:
+				return Error(errors.TEMPLATE_CONTENT_ERROR, lErrors)
+
+		# Save the record
+		bRes = oEmail.save(changes={'user': sUserID})
+
+		# Clear the cached content
+		self._contents.pop((oEmail['template'], oEmail['locale'], 'email'), None)
+
+		# Return the result
+		return Response(bRes)
 
 	def template_email_generate_create(self, req):
 		"""Template Email Generate create
@@ -1569,14 +1927,14 @@ class Mouth(Service):
 			req['data']['subject'] = ''
 
 		# Find the template variables
-		dTemplate = Template.get(req['data']['template'], raw=['variables'])
-		if not dTemplate:
+		dVariables = self._template_variables(req['data']['template'])
+		if dVariables is None:
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['template'], 'template')
 			)
 
 		# If the locale doesn't exist
-		if not Locale.exists(req['data']['locale']):
+		if not self._locale_exists(req['data']['locale']):
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['locale'], 'locale')
 			)
@@ -1587,7 +1945,7 @@ class Mouth(Service):
 				'subject': req['data']['subject'],
 				'text': req['data']['text'],
 				'html': req['data']['html']
-			}, req['data']['locale'], dTemplate['variables'])
+			}, req['data']['locale'], dVariables)
 		)
 
 	def template_sms_create(self, req):
@@ -1614,14 +1972,14 @@ class Mouth(Service):
 			)
 
 		# Make sure the template exists
-		dTemplate = Template.get(req['data']['template'], raw=['variables'])
-		if not dTemplate:
+		dVariables = self._template_variables(req['data']['template'])
+		if dVariables is None:
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['template'], 'template')
 			)
 
 		# Make sure the locale exists
-		if not Locale.exists(req['data']['locale']):
+		if not self._locale_exists(req['data']['locale']):
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['locale'], 'locale')
 			)
@@ -1636,7 +1994,7 @@ class Mouth(Service):
 		lErrors = self._checkTemplateContent(
 			req['data'],
 			['content'],
-			dTemplate['variables']
+			dVariables
 		)
 
 		# If there's any errors
@@ -1652,6 +2010,9 @@ class Mouth(Service):
 				(req['data']['locale'], 'template_locale')
 			)
 
+		# Clear the cached content
+		self._contents.pop((oSMS['template'], oSMS['locale'], 'sms'), None)
+
 		# Return the ID to indicate OK
 		return Response(oSMS['_id'])
 
@@ -1684,10 +2045,14 @@ class Mouth(Service):
 				errors.body.DB_NO_RECORD, (req['data']['_id'], 'template_sms')
 			)
 
-		# Delete the record and return the result
-		return Response(
-			oSMS.delete(changes={'user': sUserID})
-		)
+		# Delete the record
+		bRes = oSMS.delete(changes={'user': sUserID})
+
+		# Clear the cached content
+		self._contents.pop((oSMS['template'], oSMS['locale'], 'sms'), None)
+
+		# Return the result
+		return Response(bRes)
 
 	def template_sms_update(self, req):
 		"""Template SMS update
@@ -1728,23 +2093,27 @@ class Mouth(Service):
 			return Error(errors.body.DATA_FIELDS, [e.args[0]])
 
 		# Find the primary template variables
-		dTemplate = Template.get(oSMS['template'], raw=['variables'])
+		dVariables = self._template_variables(oSMS['template'])
 
 		# Check content for errors
 		lErrors = self._checkTemplateContent(
 			req['data'],
 			['content'],
-			dTemplate['variables']
+			dVariables
 		)
 
 		# If there's any errors
 		if lErrors:
 			return Error(errors.TEMPLATE_CONTENT_ERROR, lErrors)
 
-		# Save the record and return the result
-		return Response(
-			oSMS.save(changes={'user': sUserID})
-		)
+		# Save the record
+		bRes = oSMS.save(changes={'user': sUserID})
+
+		# Clear the cached content
+		self._contents.pop((oSMS['template'], oSMS['locale'], 'sms'), None)
+
+		# Return the result
+		return Response(bRes)
 
 	def template_sms_generate_create(self, req):
 		"""Template SMS Generate create
@@ -1771,12 +2140,12 @@ class Mouth(Service):
 			)
 
 		# Find the template variables
-		dTemplate = Template.get(req['data']['template'], raw=['variables'])
-		if not dTemplate:
+		dVariables = self._template_variables(req['data']['template'])
+		if dVariables is None:
 			return Error(errors.body.DB_NO_RECORD, (req['data']['template'], 'template'))
 
 		# If the locale doesn't exist
-		if not Locale.exists(req['data']['locale']):
+		if not self._locale_exists(req['data']['locale']):
 			return Error(
 				errors.body.DB_NO_RECORD, (req['data']['locale'], 'locale')
 			)
@@ -1786,7 +2155,7 @@ class Mouth(Service):
 			self._generate_sms(
 				req['data']['content'],
 				req['data']['locale'],
-				dTemplate['variables']
+				dVariables
 			)
 		)
 
@@ -25,6 +25,7 @@ setup(
 	install_requires=[
 		'body-oc>=1.0.2,<1.1',
 		'brain-oc>=1.1.9,<1.2',
+		'cachetools>=5.3.0,<6',
 		'config-oc>=1.0.3,<1.1',
 		'rest-oc>=1.3.0,<1.4',
 		'tools-oc>=1.2.4,<1.3',
@@ -0,0 +1,61 @@
+# coding=utf8
+""" Mouth email_create tests
+
+Tests the responses returned by Mouth.email_create
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__version__		= "1.0.0"
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-15"
+
+# Python imports
+import json
+import unittest
+from unittest import mock
+
+# Module imports
+from mouth import errors, Mouth
+
+class EmailCreateTest(unittest.TestCase):
+	"""Email Create Test
+
+	Tests Mouth.email_create
+	"""
+
+	def setUp(self):
+		"""Set Up
+
+		Creates a Mouth instance with the email settings needed to send, \
+		without connecting to anything
+		"""
+
+		# Create the instance without initialising it
+		self.oMouth = Mouth.__new__(Mouth)
+		self.oMouth._dEmail = {'allowed': None, 'from': 'test@localhost'}
+		self.oMouth._sEmailOverride = None
+
+	def test_bad_attachment(self):
+		"""Bad Attachment
+
+		Makes sure an attachment that isn't valid base64 returns an error \
+		that can be serialised, and not a 500
+		"""
+
+		# Send an email with an attachment that can't be decoded
+		with mock.patch('mouth.access.internal'):
+			oRes = self.oMouth.email_create({'data': {
+				'to': 'test@localhost',
+				'attachments': [{'body': 'abc', 'filename': 'test.txt'}],
+				'content': {'subject': 's', 'text': 't', 'html': 'h'}
+			}})
+
+		# Make sure the response serialises to the decode error
+		self.assertEqual(json.loads(str(oRes)), {'error': {
+			'code': errors.ATTACHMENT_DECODE,
+			'msg': 'attachments.[0]'
+		}})
+
+if __name__ == '__main__':
+	unittest.main()